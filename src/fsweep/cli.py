@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+import errno
 import fnmatch
+import importlib
 import json
 import os
+import queue
+import re
 import shutil
+import subprocess
+import sys
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Sequence
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import typer
 from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
 from fsweep.config import (
     DEFAULT_MAX_DELETE_COUNT as CONFIG_DEFAULT_MAX_DELETE_COUNT,
@@ -31,12 +50,32 @@ from fsweep.config import (
     merge_overrides,
 )
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
+try:
+    orjson: Optional[ModuleType] = importlib.import_module("orjson")
+except ModuleNotFoundError:  # pragma: no cover - optional accelerator
+    orjson = None
+
 app = typer.Typer(help="Advanced workspace cleanup tool for developers.")
-console = Console()
 BYTE_UNIT_BASE = 1024
 SCHEMA_VERSION = "1"
 INDEX_SCHEMA_VERSION = "1"
 DEFAULT_MAX_DELETE_COUNT = CONFIG_DEFAULT_MAX_DELETE_COUNT
+GLOB_METACHARS = frozenset("*?[")
+IGNORE_MARKER = ".fsweepignore"
+PARALLEL_SIZE_THRESHOLD = 4
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+PARALLEL_CLEANUP_THRESHOLD = 4
+FAST_RMTREE_MIN_BYTES = 256 * BYTE_UNIT_BASE * BYTE_UNIT_BASE
+RM_BINARY = "/bin/rm"
+UNKNOWN_SIZE = -1
+SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+SIZE_UNIT_DIVISORS = tuple(BYTE_UNIT_BASE**power for power in range(len(SIZE_UNITS)))
+PROGRESS_UPDATE_INTERVAL = 16
+QUEUE_POLL_SECONDS = 0.05
 
 
 class OutputFormat(str, Enum):
@@ -46,7 +85,7 @@ class OutputFormat(str, Enum):
     JSON = "json"
 
 
-@dataclass
+@dataclass(slots=True)
 class CleanupStats:
     """Represents the outcome of a cleanup operation."""
 
@@ -56,7 +95,7 @@ class CleanupStats:
     failed: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemResult:
     """Execution result for one matched folder."""
 
@@ -66,105 +105,163 @@ class ItemResult:
     trash_destination: Optional[Path] = None
 
 
+class FSweepLimitExceededError(Exception):
+    """Raised when a scan matches more folders than the allowed maximum."""
+
+    def __init__(self, count: int, limit: int) -> None:
+        """Record the match count and the limit it exceeded."""
+        super().__init__(f"Matched {count} folders, exceeding the limit of {limit}.")
+        self.count = count
+        self.limit = limit
+
+
 class FSweepEngine:
-    """Core engine for scanning and cleaning workspace artifacts."""
+    """Core engine for scanning and cleaning workspace artifacts.
+
+    Traversal never stats a `Path`: every file type and size comes from the
+    `os.DirEntry` yielded by `os.scandir`, whose type is filled from the
+    directory listing and whose `stat(follow_symlinks=False)` result is cached.
+    """
 
     def __init__(self, target_path: Path, config: Optional[SweepConfig] = None) -> None:
         """Initialize the engine with a scan root and config."""
         self.target_path = target_path.resolve()
+        self._target_str = str(self.target_path)
+        self._target_prefix_len = len(self._target_str.rstrip(os.sep) + os.sep)
         self.config = config or SweepConfig()
+        self._target_folders = frozenset(self.config.target_folders)
+        (
+            self._exclude_literals,
+            self._exclude_suffixes,
+            exclude_globs,
+        ) = _partition_exclude_patterns(self.config.exclude_patterns)
+        self._exclude_re = _compile_exclude_patterns(exclude_globs)
+        self._protected_set = frozenset(str(p) for p in self.config.protected_paths)
+        self._protected_prefixes = tuple(
+            str(p).rstrip(os.sep) + os.sep for p in self.config.protected_paths
+        )
         self.found_items: List[Path] = []
         self.item_sizes: Dict[Path, int] = {}
         self.total_bytes: int = 0
+        self._index_lock = threading.Lock()
+        self._mkdir_cache: set[str] = set()
 
-    def get_size(self, path: Path) -> int:
-        """Calculate folder size recursively, without following symlinks."""
-        total = 0
-        try:
-            for node in path.rglob("*"):
-                try:
-                    if node.is_symlink():
-                        total += node.lstat().st_size
-                    elif node.is_file():
-                        total += node.stat().st_size
-                except (PermissionError, OSError):
-                    continue
-        except (PermissionError, OSError):
-            pass
-        return total
+    def get_size(self, path: Path, *, jobs: int = 1) -> int:
+        """Calculate folder size recursively, without following symlinks.
+
+        With `jobs > 1`, a folder with many subdirectories is summed on up to
+        `jobs` threads.
+        """
+        return _scandir_size(str(path), jobs=jobs)
 
-    def scan(
+    def scan(  # noqa: PLR0913
         self,
         *,
         show_progress: bool = True,
         use_index: bool = True,
         index_path: Optional[Path] = None,
+        jobs: int = DEFAULT_JOBS,
+        compute_sizes: bool = True,
+        max_items: Optional[int] = None,
     ) -> None:
-        """Scan for target folders while honoring excludes and protections."""
+        """Scan for target folders while honoring excludes and protections.
+
+        Matched folders are sized on up to `jobs` threads; `jobs=1` sizes them
+        sequentially. With `compute_sizes=False` no folder is sized: every item
+        and `total_bytes` are recorded as `UNKNOWN_SIZE` and the index is left
+        untouched. If more than `max_items` folders match,
+        `FSweepLimitExceededError` is raised before any of them is sized.
+        """
+        with _scan_spinner() if show_progress else nullcontext():
+            for _ in self.iter_scan(
+                use_index=use_index,
+                index_path=index_path,
+                jobs=jobs,
+                compute_sizes=compute_sizes,
+                max_items=max_items,
+            ):
+                pass
+
+    def iter_scan(
+        self,
+        *,
+        use_index: bool = True,
+        index_path: Optional[Path] = None,
+        jobs: int = DEFAULT_JOBS,
+        compute_sizes: bool = True,
+        max_items: Optional[int] = None,
+    ) -> Iterator[Tuple[Path, int]]:
+        """Yield `(path, size)` for each matched folder as soon as it is sized.
+
+        Items arrive in walk order and are recorded on the engine as they are
+        yielded, so `found_items`, `item_sizes` and `total_bytes` are complete
+        once the iterator is exhausted. The index is written only at that point.
+        """
         self.found_items = []
         self.item_sizes = {}
-        self.total_bytes = 0
+        self.total_bytes = 0 if compute_sizes else UNKNOWN_SIZE
 
+        use_index = use_index and compute_sizes
         scan_index = _load_scan_index(index_path) if use_index else {}
         updated_index: Dict[str, Dict[str, int]] = {}
+        pending_matches = self._collect_matches()
 
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            transient=True,
-            disable=not show_progress,
-        ) as progress:
-            progress.add_task(description="Scanning for junk...", total=None)
-            for current_root, dirs, _ in os.walk(
-                self.target_path, topdown=True, followlinks=False
-            ):
-                root_path = Path(current_root)
-
-                # Skip entire tree if .fsweepignore is found
-                try:
-                    if (root_path / ".fsweepignore").exists():
-                        dirs[:] = []
-                        continue
-                except (PermissionError, OSError):
-                    pass
+        if max_items is not None and len(pending_matches) > max_items:
+            raise FSweepLimitExceededError(len(pending_matches), max_items)
 
-                walkable_dirs: List[str] = []
-
-                for name in dirs:
-                    candidate = root_path / name
-                    if self._is_excluded(candidate) or self._is_protected(candidate):
-                        continue
-                    walkable_dirs.append(name)
-                walkable_dirs.sort()
-
-                matched_dirs = [
-                    name for name in walkable_dirs if name in self.config.target_folders
-                ]
-                for name in matched_dirs:
-                    path = root_path / name
-                    size = self._size_with_index(
-                        path,
-                        scan_index,
-                        updated_index,
-                        use_index,
-                    )
-                    self.found_items.append(path)
-                    self.item_sizes[path] = size
-                    self.total_bytes += size
-
-                dirs[:] = [name for name in walkable_dirs if name not in matched_dirs]
+        if compute_sizes:
+            sizes = self._iter_match_sizes(
+                pending_matches, scan_index, updated_index, use_index, jobs=jobs
+            )
+        else:
+            sizes = iter([UNKNOWN_SIZE] * len(pending_matches))
+        for (path, _), size in zip(pending_matches, sizes):
+            self.found_items.append(path)
+            self.item_sizes[path] = size
+            if compute_sizes:
+                self.total_bytes += size
+            yield path, size
 
         if use_index:
             _write_scan_index(index_path=index_path, entries=updated_index)
 
+    def scan_json(self, items: Optional[Sequence[Path]] = None) -> Dict[str, object]:
+        """Return the latest scan results as a JSON-serializable payload.
+
+        `items` narrows the payload to a subset of `found_items`. The CLI's
+        `--output json` payload is this one plus cleanup action and status
+        fields; unknown sizes are `None`.
+        """
+        selected_items = self.found_items if items is None else items
+        if self.total_bytes == UNKNOWN_SIZE:
+            selected_total = UNKNOWN_SIZE
+        else:
+            selected_total = sum(self.item_sizes[item] for item in selected_items)
+        total_bytes, total_human = _json_size(selected_total)
+        return {
+            "schema_version": SCHEMA_VERSION,
+            "path": self._target_str,
+            "summary": {
+                "matched_count": len(selected_items),
+                "total_bytes": total_bytes,
+                "total_human": total_human,
+            },
+            "items": [
+                _item_json(self, item, self.item_sizes[item]) for item in selected_items
+            ],
+        }
+
     def format_size(self, size_bytes: int) -> str:
-        """Format bytes to a readable string."""
-        size = float(size_bytes)
-        for unit in ["B", "KB", "MB", "GB"]:
-            if round(size, 2) < BYTE_UNIT_BASE:
-                return f"{size:.2f} {unit}"
-            size /= BYTE_UNIT_BASE
-        return f"{size:.2f} TB"
+        """Format bytes to a readable string (`-` for `UNKNOWN_SIZE`)."""
+        return _format_size(size_bytes)
+
+    def relative_path(self, item: Path) -> str:
+        """Return a scanned item's path relative to the scan root.
+
+        This slices the path string instead of calling `Path.relative_to`, so it
+        is only valid for paths produced by `scan`.
+        """
+        return str(item)[self._target_prefix_len :]
 
     def cleanup(
         self,
@@ -173,33 +270,67 @@ class FSweepEngine:
         dry_run: bool,
         trash: bool = False,
         callback: Optional[Callable[[Path], None]] = None,
+        jobs: int = DEFAULT_JOBS,
     ) -> tuple[CleanupStats, List[ItemResult]]:
-        """Delete or move matched folders to the fsweep trash directory."""
+        """Delete or move matched folders to the fsweep trash directory.
+
+        Larger batches are processed on up to `jobs` threads; results are always
+        returned in input order.
+        """
         stats = CleanupStats()
-        results: List[ItemResult] = []
         trash_root = self._trash_root() if trash and not dry_run else None
 
         selected_items = list(items) if items is not None else list(self.found_items)
-        for item in selected_items:
-            if dry_run:
+        results: List[Optional[ItemResult]] = [None] * len(selected_items)
+        if dry_run:
+            outcomes: Iterator[Tuple[int, ItemResult]] = (
+                (index, ItemResult(path=item, status="simulated"))
+                for index, item in enumerate(selected_items)
+            )
+        else:
+            outcomes = self._iter_cleanup_results(
+                selected_items, trash=trash, trash_root=trash_root, jobs=jobs
+            )
+
+        for index, result in outcomes:
+            if result.status in {"simulated", "skipped"}:
                 stats.skipped += 1
-                result = ItemResult(path=item, status="simulated")
+            elif result.status == "deleted":
+                stats.deleted += 1
+            elif result.status == "trashed":
+                stats.trashed += 1
             else:
-                result = self._cleanup_one(item, trash=trash, trash_root=trash_root)
-                if result.status == "deleted":
-                    stats.deleted += 1
-                elif result.status == "trashed":
-                    stats.trashed += 1
-                elif result.status == "skipped":
-                    stats.skipped += 1
-                else:
-                    stats.failed += 1
+                stats.failed += 1
 
-            results.append(result)
+            results[index] = result
             if callback:
-                callback(item)
+                callback(result.path)
+
+        return stats, [result for result in results if result is not None]
+
+    def _iter_cleanup_results(
+        self,
+        items: Sequence[Path],
+        *,
+        trash: bool,
+        trash_root: Optional[Path],
+        jobs: int,
+    ) -> Iterator[Tuple[int, ItemResult]]:
+        """Yield `(index, result)` pairs as items finish, in completion order."""
+        if jobs <= 1 or len(items) <= PARALLEL_CLEANUP_THRESHOLD:
+            for index, item in enumerate(items):
+                yield index, self._cleanup_one(item, trash=trash, trash_root=trash_root)
+            return
 
-        return stats, results
+        with ThreadPoolExecutor(max_workers=min(jobs, len(items))) as executor:
+            futures = {
+                executor.submit(
+                    self._cleanup_one, item, trash=trash, trash_root=trash_root
+                ): index
+                for index, item in enumerate(items)
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
 
     def _cleanup_one(
         self,
@@ -215,13 +346,36 @@ class FSweepEngine:
                     path=item, status="trashed", trash_destination=destination
                 )
 
-            shutil.rmtree(item)
+            self._fast_rmtree(item)
             return ItemResult(path=item, status="deleted")
         except FileNotFoundError:
             return ItemResult(path=item, status="skipped")
         except (PermissionError, OSError) as exc:
             return ItemResult(path=item, status="failed", error=str(exc))
 
+    def _fast_rmtree(self, item: Path) -> None:
+        if (
+            os.path.islink(item)
+            or self.item_sizes.get(item, 0) < FAST_RMTREE_MIN_BYTES
+            or not os.access(RM_BINARY, os.X_OK)
+        ):
+            _rmtree(item)
+            return
+        # `rm -rf` exits 0 for a missing path; surface it as skipped instead.
+        if not os.path.lexists(item):
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), str(item))
+        completed = subprocess.run(
+            [RM_BINARY, "-rf", "--", str(item)],
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise OSError(
+                completed.stderr.strip()
+                or f"rm exited with status {completed.returncode}"
+            )
+
     def _trash_root(self) -> Path:
         timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%dT%H%M%SZ")
         trash_root = Path.home() / ".fsweep_trash" / timestamp
@@ -233,60 +387,131 @@ class FSweepEngine:
             raise OSError("trash root not initialized")
         relative = item.relative_to(self.target_path)
         destination = trash_root / relative
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        parent_key = str(destination.parent)
+        if parent_key not in self._mkdir_cache:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            self._mkdir_cache.add(parent_key)
         if destination.exists():
             destination = self._unique_path(destination)
         shutil.move(str(item), str(destination))
         return destination
 
     def _unique_path(self, path: Path) -> Path:
-        counter = 1
         while True:
-            candidate = path.with_name(f"{path.name}-{counter}")
+            candidate = path.with_name(f"{path.name}-{uuid.uuid4().hex[:8]}")
             if not candidate.exists():
                 return candidate
-            counter += 1
 
-    def _is_excluded(self, path: Path) -> bool:
-        rel = path.relative_to(self.target_path).as_posix()
-        return any(
-            fnmatch.fnmatch(rel, pattern) or fnmatch.fnmatch(path.name, pattern)
-            for pattern in self.config.exclude_patterns
-        )
+    def _collect_matches(self) -> List[Tuple[Path, str]]:
+        pending_matches: List[Tuple[Path, str]] = []
+        walk_root = self._target_str
+        if walk_root in self._protected_set or walk_root.startswith(
+            self._protected_prefixes
+        ):
+            return pending_matches
+        target_folders = self._target_folders
+        should_skip = self._should_skip
+
+        for rel_prefix, subdir_entries in _walk_scandir(
+            walk_root, prune_marker=IGNORE_MARKER
+        ):
+            walkable_entries: List[Tuple[os.DirEntry[str], str]] = []
+            for entry in subdir_entries:
+                canonical_path = _canonical_entry_path(entry)
+                if should_skip(
+                    entry.name,
+                    canonical_path,
+                    rel_prefix + entry.name,
+                    is_link=entry.is_symlink(),
+                ):
+                    continue
+                walkable_entries.append((entry, canonical_path))
+            walkable_entries.sort(key=lambda pair: pair[0].name)
 
-    def _is_protected(self, path: Path) -> bool:
+            remaining_entries: List[os.DirEntry[str]] = []
+            for entry, canonical_path in walkable_entries:
+                if entry.name in target_folders:
+                    pending_matches.append((Path(entry.path), canonical_path))
+                else:
+                    remaining_entries.append(entry)
+            subdir_entries[:] = remaining_entries
+        return pending_matches
+
+    def _should_skip(self, name: str, path: str, rel: str, *, is_link: bool) -> bool:
+        name = os.path.normcase(name)
+        rel = os.path.normcase(rel)
+        if name in self._exclude_literals or rel in self._exclude_literals:
+            return True
+        # Protected trees are pruned where they start, so a walked directory can
+        # only sit inside one when it is a symlink pointing there.
+        if path in self._protected_set:
+            return True
+        if is_link and path.startswith(self._protected_prefixes):
+            return True
+        if rel.endswith(self._exclude_suffixes):
+            return True
+        if self._exclude_re is None:
+            return False
+        return bool(self._exclude_re.match(rel) or self._exclude_re.match(name))
+
+    def _iter_match_sizes(
+        self,
+        matches: Sequence[Tuple[Path, str]],
+        scan_index: Dict[str, Dict[str, int]],
+        updated_index: Dict[str, Dict[str, int]],
+        use_index: bool,
+        *,
+        jobs: int,
+    ) -> Iterator[int]:
+        def size_one(match: Tuple[Path, str], size_jobs: int = 1) -> int:
+            path, path_key = match
+            return self._size_with_index(
+                path, path_key, scan_index, updated_index, use_index, jobs=size_jobs
+            )
+
+        if jobs <= 1 or len(matches) < PARALLEL_SIZE_THRESHOLD:
+            yield from (size_one(match, jobs) for match in matches)
+            return
+        executor = ThreadPoolExecutor(max_workers=min(jobs, len(matches)))
         try:
-            candidate = path.resolve()
-        except OSError:
-            candidate = path.absolute()
-        for protected in self.config.protected_paths:
-            if candidate == protected or protected in candidate.parents:
-                return True
-        return False
+            yield from executor.map(size_one, matches)
+        finally:
+            executor.shutdown(cancel_futures=True)
 
-    def _size_with_index(
+    def _size_with_index(  # noqa: PLR0913
         self,
         path: Path,
+        path_key: str,
         scan_index: Dict[str, Dict[str, int]],
         updated_index: Dict[str, Dict[str, int]],
         use_index: bool,
+        *,
+        jobs: int = 1,
     ) -> int:
-        path_key = str(path.resolve())
-        mtime_ns = _directory_mtime_ns(path)
-        if use_index:
-            cached_entry = scan_index.get(path_key)
-            if (
-                cached_entry is not None
-                and cached_entry.get("mtime_ns") == mtime_ns
-                and "size_bytes" in cached_entry
-            ):
-                size = int(cached_entry["size_bytes"])
-                updated_index[path_key] = {"mtime_ns": mtime_ns, "size_bytes": size}
-                return size
+        if not use_index:
+            return self.get_size(path, jobs=jobs)
 
-        size = self.get_size(path)
-        if use_index:
-            updated_index[path_key] = {"mtime_ns": mtime_ns, "size_bytes": size}
+        try:
+            stat_result = os.stat(path_key, follow_symlinks=False)
+            mtime_ns, inode = stat_result.st_mtime_ns, stat_result.st_ino
+        except OSError:
+            mtime_ns, inode = 0, 0
+        cached_entry = scan_index.get(path_key)
+        if (
+            cached_entry is not None
+            and cached_entry.get("mtime_ns") == mtime_ns
+            and cached_entry.get("inode") == inode
+            and "size_bytes" in cached_entry
+        ):
+            size = int(cached_entry["size_bytes"])
+        else:
+            size = self.get_size(path, jobs=jobs)
+        with self._index_lock:
+            updated_index[path_key] = {
+                "mtime_ns": mtime_ns,
+                "inode": inode,
+                "size_bytes": size,
+            }
         return size
 
 
@@ -355,6 +580,20 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
         help="Path to scan index JSON file (default: <scan_path>/.fsweep-index.json).",
         rich_help_panel="Execution",
     ),
+    jobs: int = typer.Option(
+        DEFAULT_JOBS,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Worker threads for sizing and removing folders (1 is sequential).",
+        rich_help_panel="Execution",
+    ),
+    size: bool = typer.Option(
+        True,
+        "--size/--no-size",
+        help="Compute folder sizes (--no-size skips sizing for faster runs).",
+        rich_help_panel="Execution",
+    ),
     config: Optional[Path] = typer.Option(
         None,
         "--config",
@@ -418,7 +657,7 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
         _exit_with_error(f"Path {path} does not exist.", output)
     if resolved_path == Path("/"):
         _exit_with_error("Refusing to sweep filesystem root ('/').", output)
-    if resolved_path == Path.home().resolve():
+    if resolved_path == _resolved_home():
         _exit_with_error("Refusing to sweep your home directory root.", output)
 
     effective_config = _build_effective_config(
@@ -444,12 +683,25 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
             output,
         )
 
+    enforce_delete_limit = destructive_mode and not no_delete_limit
     engine = FSweepEngine(resolved_path, effective_config)
-    engine.scan(
-        show_progress=output == OutputFormat.TABLE,
+    scan_results = engine.iter_scan(
         use_index=use_index,
         index_path=index_file or (resolved_path / ".fsweep-index.json"),
+        jobs=jobs,
+        compute_sizes=size,
+        max_items=(
+            max_delete_count if enforce_delete_limit and not interactive else None
+        ),
     )
+    try:
+        if output == OutputFormat.TABLE:
+            _stream_scan_results(scan_results, engine=engine)
+        else:
+            for _ in scan_results:
+                pass
+    except FSweepLimitExceededError as exc:
+        _exit_with_error(_delete_limit_message(exc.count, exc.limit), output)
     selected_items = list(engine.found_items)
     selected_sizes = dict(engine.item_sizes)
 
@@ -458,39 +710,29 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
             selected_items,
             selected_sizes,
             engine=engine,
-            base_path=resolved_path,
         )
         selected_sizes = {item: selected_sizes[item] for item in selected_items}
+    selected_total = sum(selected_sizes.values()) if size else UNKNOWN_SIZE
 
     if not selected_items:
         if output == OutputFormat.TABLE:
             rprint("[bold green]Everything is clean. No junk found.[/bold green]")
         _emit_json(
             output,
-            {
-                "schema_version": SCHEMA_VERSION,
-                "path": str(resolved_path),
-                "dry_run": effective_dry_run,
-                "action": "trash" if trash else "delete",
-                "summary": {"deleted": 0, "trashed": 0, "skipped": 0, "failed": 0},
-                "items": [],
-            },
+            _build_json_payload(
+                engine=engine,
+                effective_dry_run=effective_dry_run,
+                trash=trash,
+                selected_items=[],
+                stats=CleanupStats(),
+                result_map={},
+            ),
         )
         return
 
-    if (
-        destructive_mode
-        and not no_delete_limit
-        and len(selected_items) > max_delete_count
-    ):
+    if enforce_delete_limit and len(selected_items) > max_delete_count:
         _exit_with_error(
-            (
-                "Refusing to delete "
-                f"{len(selected_items)} folders because it exceeds "
-                f"--max-delete-count={max_delete_count}. "
-                "Use --no-delete-limit to override."
-            ),
-            output,
+            _delete_limit_message(len(selected_items), max_delete_count), output
         )
 
     if output == OutputFormat.TABLE:
@@ -500,18 +742,22 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
             if effective_dry_run
             else "[bold blue]Developer Workspace FSweep[/bold blue]"
         )
+        from rich.panel import Panel  # noqa: PLC0415
+
         rprint(Panel.fit(banner_text, border_style=banner_style))
-        _print_results_table(selected_items, selected_sizes, base_path=resolved_path)
-        summary_label = (
-            "Total Estimated Savings (Simulation):"
-            if effective_dry_run
-            else "Total Potential Savings:"
-        )
-        selected_total = sum(selected_sizes[item] for item in selected_items)
-        rprint(
-            f"\n[bold]{summary_label}[/bold] "
-            f"[green]{engine.format_size(selected_total)}[/green]\n"
-        )
+        _print_results_table(selected_items, selected_sizes, engine=engine)
+        if size:
+            summary_label = (
+                "Total Estimated Savings (Simulation):"
+                if effective_dry_run
+                else "Total Potential Savings:"
+            )
+            rprint(
+                f"\n[bold]{summary_label}[/bold] "
+                f"[green]{engine.format_size(selected_total)}[/green]\n"
+            )
+        else:
+            rprint("\n[dim](sizes skipped; pass --size to compute)[/dim]\n")
 
     if destructive_mode and not force:
         prompt = (
@@ -530,18 +776,29 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
         if effective_dry_run
         else ("[magenta]Trashing..." if trash else "[red]Deleting...")
     )
-    with Progress(disable=output == OutputFormat.JSON) as progress:
-        task = progress.add_task(action_text, total=len(selected_items))
+    with _progress_callback(
+        action_text,
+        total=len(selected_items),
+        enabled=output == OutputFormat.TABLE,
+    ) as advance:
         stats, results = engine.cleanup(
             selected_items,
             dry_run=effective_dry_run,
             trash=trash,
-            callback=lambda _: progress.update(task, advance=1),
+            callback=advance,
+            jobs=jobs,
         )
+    result_map = {result.path: result for result in results}
 
     if output == OutputFormat.TABLE:
-        recovered_size = engine.format_size(sum(selected_sizes.values()))
-        if effective_dry_run:
+        recovered_size = engine.format_size(selected_total)
+        if not size:
+            rprint(
+                "\n[bold yellow]Dry-run complete.[/bold yellow]"
+                if effective_dry_run
+                else "\n[bold green]Cleanup complete.[/bold green]"
+            )
+        elif effective_dry_run:
             rprint(
                 f"\n[bold yellow]Dry-run complete. "
                 f"Would have recovered {recovered_size}.[/bold yellow]"
@@ -556,6 +813,8 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
         else:
             rprint(f"\n[bold green]Recovered up to {recovered_size}.[/bold green]")
 
+        from rich.table import Table  # noqa: PLC0415
+
         summary_table = Table(title="Cleanup Summary", title_style="bold cyan")
         summary_table.add_column("Deleted", justify="right", style="green")
         summary_table.add_column("Trashed", justify="right", style="magenta")
@@ -567,7 +826,7 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
             str(stats.skipped),
             str(stats.failed),
         )
-        console.print(summary_table)
+        _console().print(summary_table)
 
     if report:
         _write_markdown_report(
@@ -578,21 +837,20 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
             trash=trash,
             selected_items=selected_items,
             selected_sizes=selected_sizes,
+            selected_total=selected_total,
             stats=stats,
-            results=results,
+            result_map=result_map,
         )
 
     _emit_json(
         output,
         _build_json_payload(
             engine=engine,
-            scan_path=resolved_path,
             effective_dry_run=effective_dry_run,
             trash=trash,
             selected_items=selected_items,
-            selected_sizes=selected_sizes,
             stats=stats,
-            results=results,
+            result_map=result_map,
         ),
     )
 
@@ -610,6 +868,9 @@ def clean(  # noqa: PLR0912, PLR0913, PLR0915
 @app.command()
 def system() -> None:
     """Show hints for cleaning global toolchain artifacts."""
+    from rich.panel import Panel  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
     rprint(Panel("[bold blue]System-wide Cleanup Recommendations[/bold blue]"))
 
     table = Table(box=None, padding=(0, 2))
@@ -639,6 +900,74 @@ def system() -> None:
     )
 
 
+@cache
+def _console() -> Console:
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console()
+
+
+@cache
+def _resolved_home() -> Path:
+    """Return the resolved home directory, cached for the life of the process."""
+    return Path.home().resolve()
+
+
+def _scan_spinner() -> Progress:
+    from rich.progress import Progress, SpinnerColumn, TextColumn  # noqa: PLC0415
+
+    progress = Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        transient=True,
+    )
+    progress.add_task(description="Scanning for junk...", total=None)
+    return progress
+
+
+def _stream_scan_results(
+    results: Iterator[Tuple[Path, int]],
+    *,
+    engine: FSweepEngine,
+) -> None:
+    from rich.live import Live  # noqa: PLC0415
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(title="Scanning for junk...", title_style="bold magenta")
+    table.add_column("Directory Relative Path", style="cyan")
+    table.add_column("Size", justify="right", style="green")
+    with Live(table, console=_console(), transient=True, refresh_per_second=8):
+        for item, item_size in results:
+            table.add_row(engine.relative_path(item), _format_size(item_size))
+
+
+@contextmanager
+def _progress_callback(
+    description: str,
+    *,
+    total: int,
+    enabled: bool,
+) -> Iterator[Optional[Callable[[Path], None]]]:
+    if not enabled:
+        yield None
+        return
+
+    from rich.progress import Progress  # noqa: PLC0415
+
+    with Progress(refresh_per_second=10) as progress:
+        task = progress.add_task(description, total=total)
+        completed = 0
+
+        def advance(_: Path) -> None:
+            nonlocal completed
+            completed += 1
+            if completed % PROGRESS_UPDATE_INTERVAL == 0:
+                progress.update(task, completed=completed)
+
+        yield advance
+        progress.update(task, completed=completed)
+
+
 def _build_effective_config(  # noqa: PLR0913
     *,
     scan_path: Path,
@@ -674,13 +1003,24 @@ def _build_effective_config(  # noqa: PLR0913
     return merge_overrides(effective_config, cli_overrides)
 
 
+def _delete_limit_message(count: int, limit: int) -> str:
+    return (
+        f"Refusing to delete {count} folders because it exceeds "
+        f"--max-delete-count={limit}. Use --no-delete-limit to override."
+    )
+
+
 def _print_results_table(
     selected_items: Sequence[Path],
     selected_sizes: Dict[Path, int],
     *,
-    base_path: Path,
+    engine: FSweepEngine,
 ) -> None:
-    table = Table(title=f"Results for {base_path.name}", title_style="bold magenta")
+    from rich.table import Table  # noqa: PLC0415
+
+    table = Table(
+        title=f"Results for {engine.target_path.name}", title_style="bold magenta"
+    )
     table.add_column("#", style="white", justify="right")
     table.add_column("Directory Relative Path", style="cyan")
     table.add_column("Type", style="yellow")
@@ -688,11 +1028,11 @@ def _print_results_table(
     for idx, item in enumerate(selected_items, start=1):
         table.add_row(
             str(idx),
-            str(item.relative_to(base_path)),
+            engine.relative_path(item),
             item.name,
             _format_size(selected_sizes[item]),
         )
-    console.print(table)
+    _console().print(table)
 
 
 def _select_items_interactively(
@@ -700,8 +1040,9 @@ def _select_items_interactively(
     item_sizes: Dict[Path, int],
     *,
     engine: FSweepEngine,
-    base_path: Path,
 ) -> List[Path]:
+    from rich.table import Table  # noqa: PLC0415
+
     table = Table(title="Interactive Selection", title_style="bold cyan")
     table.add_column("#", justify="right")
     table.add_column("Directory Relative Path")
@@ -709,10 +1050,10 @@ def _select_items_interactively(
     for idx, item in enumerate(items, start=1):
         table.add_row(
             str(idx),
-            str(item.relative_to(base_path)),
+            engine.relative_path(item),
             engine.format_size(item_sizes[item]),
         )
-    console.print(table)
+    _console().print(table)
 
     selection = typer.prompt(
         "Select folders ([all], none, or comma-separated indexes)",
@@ -750,53 +1091,54 @@ def _select_items_interactively(
 def _build_json_payload(  # noqa: PLR0913
     *,
     engine: FSweepEngine,
-    scan_path: Path,
     effective_dry_run: bool,
     trash: bool,
     selected_items: Sequence[Path],
-    selected_sizes: Dict[Path, int],
     stats: CleanupStats,
-    results: Sequence[ItemResult],
+    result_map: Dict[Path, ItemResult],
 ) -> Dict[str, object]:
-    result_map = {result.path: result for result in results}
     action = "trash" if trash else "delete"
-    items_payload: List[Dict[str, object]] = []
-    for item in selected_items:
+    payload = engine.scan_json(selected_items)
+    payload["dry_run"] = effective_dry_run
+    payload["action"] = action
+    cast(Dict[str, object], payload["summary"]).update(
+        deleted=stats.deleted,
+        trashed=stats.trashed,
+        skipped=stats.skipped,
+        failed=stats.failed,
+    )
+    for item, item_payload in zip(
+        selected_items, cast(List[Dict[str, object]], payload["items"])
+    ):
         result = result_map[item]
-        items_payload.append(
-            {
-                "path": str(item),
-                "relative_path": str(item.relative_to(scan_path)),
-                "type": item.name,
-                "size_bytes": selected_sizes[item],
-                "size_human": engine.format_size(selected_sizes[item]),
-                "action": "simulate" if effective_dry_run else action,
-                "status": result.status,
-                "error": result.error,
-                "trash_destination": (
-                    str(result.trash_destination) if result.trash_destination else None
-                ),
-            }
+        item_payload.update(
+            action="simulate" if effective_dry_run else action,
+            status=result.status,
+            error=result.error,
+            trash_destination=(
+                str(result.trash_destination) if result.trash_destination else None
+            ),
         )
+    return payload
+
 
+def _item_json(engine: FSweepEngine, item: Path, size_bytes: int) -> Dict[str, object]:
+    json_bytes, json_human = _json_size(size_bytes)
     return {
-        "schema_version": SCHEMA_VERSION,
-        "path": str(scan_path),
-        "dry_run": effective_dry_run,
-        "action": action,
-        "summary": {
-            "matched_count": len(selected_items),
-            "total_bytes": sum(selected_sizes.values()),
-            "total_human": engine.format_size(sum(selected_sizes.values())),
-            "deleted": stats.deleted,
-            "trashed": stats.trashed,
-            "skipped": stats.skipped,
-            "failed": stats.failed,
-        },
-        "items": items_payload,
+        "path": str(item),
+        "relative_path": engine.relative_path(item),
+        "type": item.name,
+        "size_bytes": json_bytes,
+        "size_human": json_human,
     }
 
 
+def _json_size(size_bytes: int) -> Tuple[Optional[int], Optional[str]]:
+    if size_bytes == UNKNOWN_SIZE:
+        return None, None
+    return size_bytes, _format_size(size_bytes)
+
+
 def _write_markdown_report(  # noqa: PLR0913
     *,
     report_path: Path,
@@ -806,53 +1148,52 @@ def _write_markdown_report(  # noqa: PLR0913
     trash: bool,
     selected_items: Sequence[Path],
     selected_sizes: Dict[Path, int],
+    selected_total: int,
     stats: CleanupStats,
-    results: Sequence[ItemResult],
+    result_map: Dict[Path, ItemResult],
 ) -> None:
     action = "trash" if trash else "delete"
-    lines: List[str] = []
-    lines.append("# fsweep report")
-    lines.append("")
-    lines.append(f"- generated_at_utc: {datetime.now(tz=timezone.utc).isoformat()}")
-    lines.append(f"- path: `{path}`")
-    lines.append(f"- dry_run: `{effective_dry_run}`")
-    lines.append(f"- action: `{action}`")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append("")
-    lines.append(f"- matched_count: {len(selected_items)}")
-    lines.append(f"- total_human: {engine.format_size(sum(selected_sizes.values()))}")
-    lines.append(f"- deleted: {stats.deleted}")
-    lines.append(f"- trashed: {stats.trashed}")
-    lines.append(f"- skipped: {stats.skipped}")
-    lines.append(f"- failed: {stats.failed}")
-    lines.append("")
-    lines.append("## Items")
-    lines.append("")
-    lines.append("| path | size | status | error |")
-    lines.append("| :--- | ---: | :----- | :---- |")
-    result_map = {result.path: result for result in results}
-    for item in selected_items:
-        result = result_map[item]
-        error = result.error or ""
-        lines.append(
-            (
+    generated_at = datetime.now(tz=timezone.utc).isoformat()
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with report_path.open("w") as report_file:
+        report_file.write(
+            "# fsweep report\n"
+            "\n"
+            f"- generated_at_utc: {generated_at}\n"
+            f"- path: `{path}`\n"
+            f"- dry_run: `{effective_dry_run}`\n"
+            f"- action: `{action}`\n"
+            "\n"
+            "## Summary\n"
+            "\n"
+            f"- matched_count: {len(selected_items)}\n"
+            f"- total_human: {engine.format_size(selected_total)}\n"
+            f"- deleted: {stats.deleted}\n"
+            f"- trashed: {stats.trashed}\n"
+            f"- skipped: {stats.skipped}\n"
+            f"- failed: {stats.failed}\n"
+            "\n"
+            "## Items\n"
+            "\n"
+            "| path | size | status | error |\n"
+            "| :--- | ---: | :----- | :---- |\n"
+        )
+        for item in selected_items:
+            result = result_map[item]
+            report_file.write(
                 f"| `{item}` | {engine.format_size(selected_sizes[item])} | "
-                f"{result.status} | {error} |"
+                f"{result.status} | {result.error or ''} |\n"
             )
-        )
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text("\n".join(lines) + "\n")
 
 
 def _load_scan_index(index_path: Optional[Path]) -> Dict[str, Dict[str, int]]:
     if index_path is None or not index_path.exists():
         return {}
     try:
-        raw = json.loads(index_path.read_text())
-    except (OSError, json.JSONDecodeError):
+        raw = _loads_index(index_path.read_bytes())
+    except (OSError, ValueError):
         return {}
-    if raw.get("schema_version") != INDEX_SCHEMA_VERSION:
+    if not isinstance(raw, dict) or raw.get("schema_version") != INDEX_SCHEMA_VERSION:
         return {}
     entries = raw.get("entries", {})
     if not isinstance(entries, dict):
@@ -863,9 +1204,14 @@ def _load_scan_index(index_path: Optional[Path]) -> Dict[str, Dict[str, int]]:
         if not isinstance(path_key, str) or not isinstance(entry, dict):
             continue
         mtime_ns = entry.get("mtime_ns")
+        inode = entry.get("inode")
         size_bytes = entry.get("size_bytes")
-        if isinstance(mtime_ns, int) and isinstance(size_bytes, int):
-            parsed[path_key] = {"mtime_ns": mtime_ns, "size_bytes": size_bytes}
+        if all(isinstance(value, int) for value in (mtime_ns, inode, size_bytes)):
+            parsed[path_key] = {
+                "mtime_ns": mtime_ns,
+                "inode": inode,
+                "size_bytes": size_bytes,
+            }
     return parsed
 
 
@@ -877,32 +1223,202 @@ def _write_scan_index(
     if index_path is None:
         return
     payload = {"schema_version": INDEX_SCHEMA_VERSION, "entries": entries}
+    tmp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex[:8]}.tmp")
     try:
         index_path.parent.mkdir(parents=True, exist_ok=True)
-        index_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+        tmp_path.write_bytes(_dumps_index(payload))
+        os.replace(tmp_path, index_path)
     except OSError:
-        return
+        tmp_path.unlink(missing_ok=True)
+
+
+def _dumps_index(payload: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _loads_index(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _partition_exclude_patterns(
+    patterns: Sequence[str],
+) -> tuple[frozenset[str], tuple[str, ...], List[str]]:
+    literals: set[str] = set()
+    suffixes: List[str] = []
+    globs: List[str] = []
+    for pattern in patterns:
+        normalized = os.path.normcase(pattern)
+        if not GLOB_METACHARS.intersection(normalized):
+            literals.add(normalized)
+        elif normalized.startswith("*") and not GLOB_METACHARS.intersection(
+            normalized[1:]
+        ):
+            suffixes.append(normalized[1:])
+        else:
+            globs.append(pattern)
+    return frozenset(literals), tuple(suffixes), globs
+
+
+def _compile_exclude_patterns(patterns: Sequence[str]) -> Optional[re.Pattern[str]]:
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(
+            f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+            for pattern in patterns
+        )
+    )
+
+
+def _canonical_entry_path(entry: os.DirEntry[str]) -> str:
+    return os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+
+
+def _walk_scandir(
+    root: str,
+    *,
+    prune_marker: Optional[str] = None,
+) -> Iterator[Tuple[str, List[os.DirEntry[str]]]]:
+    pending = [(root, "")]
+    while pending:
+        current_root, rel_prefix = pending.pop()
+        subdir_entries: List[os.DirEntry[str]] = []
+        marked = False
+        try:
+            with os.scandir(current_root) as entries:
+                for entry in entries:
+                    if entry.name == prune_marker:
+                        marked = True
+                        break
+                    try:
+                        if entry.is_dir():
+                            subdir_entries.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+        if marked:
+            continue
 
+        yield rel_prefix, subdir_entries
 
-def _directory_mtime_ns(path: Path) -> int:
+        pending.extend(
+            (entry.path, f"{rel_prefix}{entry.name}/")
+            for entry in reversed(subdir_entries)
+            if not entry.is_symlink()
+        )
+
+
+def _scandir_size(path: str, *, jobs: int = 1) -> int:
+    pending: List[str] = []
+    total = _scandir_level_size(path, pending)
+    if jobs > 1 and len(pending) > PARALLEL_SIZE_THRESHOLD:
+        return total + _shared_queue_size(pending, jobs)
+    while pending:
+        total += _scandir_level_size(pending.pop(), pending)
+    return total
+
+
+def _shared_queue_size(subdirs: List[str], jobs: int) -> int:
+    work: queue.SimpleQueue[str] = queue.SimpleQueue()
+    for subdir in subdirs:
+        work.put(subdir)
+    remaining = len(subdirs)
+    remaining_lock = threading.Lock()
+    finished = threading.Event()
+
+    def drain() -> int:
+        nonlocal remaining
+        total = 0
+        try:
+            while not finished.is_set():
+                try:
+                    path = work.get(timeout=QUEUE_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                children: List[str] = []
+                total += _scandir_level_size(path, children)
+                for child in children:
+                    work.put(child)
+                with remaining_lock:
+                    remaining += len(children) - 1
+                    if remaining == 0:
+                        finished.set()
+        except BaseException:
+            finished.set()
+            raise
+        return total
+
+    workers = min(jobs, len(subdirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(drain) for _ in range(workers)]
+        try:
+            while not finished.wait(QUEUE_POLL_SECONDS):
+                pass
+        finally:
+            finished.set()
+        return sum(future.result() for future in futures)
+
+
+def _scandir_level_size(path: str, pending: List[str]) -> int:
+    total = 0
     try:
-        return path.stat().st_mtime_ns
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    else:
+                        total += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
     except OSError:
-        return 0
+        pass
+    return total
+
+
+def _rmtree(path: Path) -> None:
+    root = os.fspath(path)
+
+    def on_exc(_: Callable[..., object], failed: str, exc: BaseException) -> None:
+        if isinstance(exc, FileNotFoundError) and os.fspath(failed) != root:
+            return
+        raise exc
+
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=on_exc)
+    else:  # pragma: no cover - Python 3.10/3.11 signature
+        shutil.rmtree(
+            path,
+            onerror=lambda func, failed, exc_info: on_exc(func, failed, exc_info[1]),
+        )
 
 
 def _emit_json(output: OutputFormat, payload: Dict[str, object]) -> None:
     if output == OutputFormat.JSON:
-        typer.echo(json.dumps(payload, indent=2, sort_keys=True))
+        typer.echo(_dumps_output_json(payload))
+
+
+def _dumps_output_json(payload: Dict[str, object]) -> Union[str, bytes]:
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False)
 
 
+@lru_cache(maxsize=4096)
 def _format_size(size_bytes: int) -> str:
-    size = float(size_bytes)
-    for unit in ["B", "KB", "MB", "GB"]:
-        if round(size, 2) < BYTE_UNIT_BASE:
-            return f"{size:.2f} {unit}"
+    if size_bytes == UNKNOWN_SIZE:
+        return "-"
+    index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    size = size_bytes / SIZE_UNIT_DIVISORS[index]
+    if index < len(SIZE_UNITS) - 1 and round(size, 2) >= BYTE_UNIT_BASE:
+        index += 1
         size /= BYTE_UNIT_BASE
-    return f"{size:.2f} TB"
+    return f"{size:.2f} {SIZE_UNITS[index]}"
 
 
 def _exit_with_error(
@@ -912,14 +1428,12 @@ def _exit_with_error(
 ) -> None:
     if output == OutputFormat.JSON:
         typer.echo(
-            json.dumps(
+            _dumps_output_json(
                 {
                     "schema_version": SCHEMA_VERSION,
                     "error": message,
                     "exit_code": exit_code,
-                },
-                indent=2,
-                sort_keys=True,
+                }
             )
         )
     else:
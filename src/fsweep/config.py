@@ -3,7 +3,7 @@
 import importlib
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 try:
     tomllib = importlib.import_module("tomllib")
@@ -13,45 +13,48 @@ TOMLDecodeError = getattr(tomllib, "TOMLDecodeError", ValueError)
 
 DEFAULT_MAX_DELETE_COUNT = 50
 
-DEFAULT_TARGET_FOLDERS: Set[str] = {
-    # JavaScript / TypeScript
-    ".astro",
-    ".eslintcache",
-    ".next",
-    ".nuxt",
-    ".parcel-cache",
-    ".pnpm-store",
-    ".svelte-kit",
-    ".turbo",
-    ".vercel",
-    ".vite",
-    ".wrangler",
-    "node_modules",
-    # Python
-    ".ipynb_checkpoints",
-    ".mypy_cache",
-    ".nox",
-    ".pytest_cache",
-    ".ruff_cache",
-    ".rumdl_cache",
-    ".tox",
-    ".uv-cache",
-    ".venv",
-    "__pycache__",
-    "venv",
-    # Build / Test Artifacts
-    ".cache",
-    ".nyc_output",
-    "coverage",
-    "htmlcov",
-    # JVM / .NET / Rust
-    ".gradle",
-    # Infrastructure as Code
-    ".aws-sam",
-    ".serverless",
-    ".terraform",
-    ".terragrunt-cache",
-}
+# Frozen so importers of the shared defaults cannot mutate them in place.
+DEFAULT_TARGET_FOLDERS: FrozenSet[str] = frozenset(
+    {
+        # JavaScript / TypeScript
+        ".astro",
+        ".eslintcache",
+        ".next",
+        ".nuxt",
+        ".parcel-cache",
+        ".pnpm-store",
+        ".svelte-kit",
+        ".turbo",
+        ".vercel",
+        ".vite",
+        ".wrangler",
+        "node_modules",
+        # Python
+        ".ipynb_checkpoints",
+        ".mypy_cache",
+        ".nox",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".rumdl_cache",
+        ".tox",
+        ".uv-cache",
+        ".venv",
+        "__pycache__",
+        "venv",
+        # Build / Test Artifacts
+        ".cache",
+        ".nyc_output",
+        "coverage",
+        "htmlcov",
+        # JVM / .NET / Rust
+        ".gradle",
+        # Infrastructure as Code
+        ".aws-sam",
+        ".serverless",
+        ".terraform",
+        ".terragrunt-cache",
+    }
+)
 
 
 @dataclass
@@ -168,8 +171,10 @@ def _coerce_str_list(
 
 def _merge_unique(left: List[str], right: List[str]) -> List[str]:
     merged = list(left)
+    seen = set(left)
     for item in right:
-        if item not in merged:
+        if item not in seen:
+            seen.add(item)
             merged.append(item)
     return merged
 
@@ -186,4 +191,4 @@ def _merge_unique_paths(left: List[Path], right: List[Path]) -> List[Path]:
 
 
 # Backward-compatible import used in existing tests.
-TARGET_FOLDERS: Set[str] = DEFAULT_TARGET_FOLDERS
+TARGET_FOLDERS: FrozenSet[str] = DEFAULT_TARGET_FOLDERS
@@ -1,16 +1,17 @@
 """Tests for fsweep CLI behavior and engine basics."""
 
 import json
+import runpy
 import shutil
-import subprocess
 import sys
 import textwrap
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from typer.testing import CliRunner
 
-from fsweep.cli import DEFAULT_MAX_DELETE_COUNT, FSweepEngine, app
+from fsweep.cli import DEFAULT_MAX_DELETE_COUNT, FSweepEngine, _resolved_home, app
 from fsweep.config import TARGET_FOLDERS
 
 runner = CliRunner()
@@ -41,6 +42,29 @@ def mock_workspace(tmp_path: Path) -> Path:
     return tmp_path
 
 
+@pytest.fixture
+def stub_orjson(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Installs an orjson stand-in that, like orjson, dumps to bytes."""
+    indent_2, sort_keys = 1, 2
+
+    def dumps(payload: object, option: int = 0) -> bytes:
+        return json.dumps(
+            payload,
+            indent=2 if option & indent_2 else None,
+            sort_keys=bool(option & sort_keys),
+            ensure_ascii=False,
+        ).encode()
+
+    stub = SimpleNamespace(
+        OPT_INDENT_2=indent_2,
+        OPT_SORT_KEYS=sort_keys,
+        dumps=dumps,
+        loads=json.loads,
+    )
+    monkeypatch.setattr("fsweep.cli.orjson", stub)
+    return stub
+
+
 def test_fsweep_finds_targeted_folders(mock_workspace: Path) -> None:
     """Verify that the engine only finds folders in TARGET_FOLDERS."""
     engine = FSweepEngine(mock_workspace)
@@ -100,6 +124,28 @@ def test_scan_respects_fsweepignore(tmp_path: Path) -> None:
     assert len(engine.found_items) == 0
 
 
+@pytest.mark.usefixtures("stub_orjson")
+def test_scan_index_round_trips_through_orjson(
+    mock_workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the orjson index path writes a reusable, stdlib-readable index."""
+    index_file = mock_workspace / ".fsweep-index.json"
+    first_engine = FSweepEngine(mock_workspace)
+    first_engine.scan(show_progress=False, index_path=index_file)
+
+    contents = json.loads(index_file.read_bytes())
+    assert contents["schema_version"] == "1"
+    assert len(contents["entries"]) == EXPECTED_FOUND_ITEMS
+
+    def fail_get_size(*_: object, **__: object) -> int:
+        raise AssertionError("get_size should not run when the index is valid")
+
+    second_engine = FSweepEngine(mock_workspace)
+    monkeypatch.setattr(second_engine, "get_size", fail_get_size)
+    second_engine.scan(show_progress=False, index_path=index_file)
+    assert second_engine.item_sizes == first_engine.item_sizes
+
+
 def test_cli_dry_run(mock_workspace: Path) -> None:
     """Verify that --dry-run flag is accepted and simulation is reported."""
     result = runner.invoke(app, ["clean", "--path", str(mock_workspace)])
@@ -149,6 +195,22 @@ def test_cli_refuses_home_root_path() -> None:
     assert "Refusing to sweep your home directory root" in result.stdout
 
 
+def test_cli_refuses_patched_home_root_path(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify the home check follows HOME once the cached value is cleared."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    _resolved_home.cache_clear()
+    try:
+        result = runner.invoke(
+            app, ["clean", "--path", str(tmp_path), "--delete", "--yes-delete"]
+        )
+    finally:
+        _resolved_home.cache_clear()
+    assert result.exit_code == 1
+    assert "Refusing to sweep your home directory root" in result.stdout
+
+
 def test_cli_applies_max_delete_count_limit(tmp_path: Path) -> None:
     """Verify max-delete-count blocks large destructive runs."""
     for idx in range(DEFAULT_MAX_DELETE_COUNT + 1):
@@ -182,16 +244,17 @@ def test_cli_no_delete_limit_allows_large_run(tmp_path: Path) -> None:
     assert result.exit_code == 0
 
 
-def test_python_module_entrypoint_help() -> None:
+def test_python_module_entrypoint_help(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
     """Verify `python -m fsweep --help` exits successfully."""
-    result = subprocess.run(
-        [sys.executable, "-m", "fsweep", "--help"],
-        check=False,
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "Usage:" in result.stdout
+    # runpy executes the same `__main__` module in-process, without paying for
+    # a fresh interpreter start.
+    monkeypatch.setattr(sys, "argv", ["fsweep", "--help"])
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_module("fsweep", run_name="__main__")
+    assert exc_info.value.code == 0
+    assert "Usage:" in capsys.readouterr().out
 
 
 def test_cli_exits_non_zero_on_delete_failure(
@@ -203,7 +266,7 @@ def test_cli_exits_non_zero_on_delete_failure(
     target.mkdir(parents=True)
     (target / "file.txt").write_text("content")
 
-    def fake_rmtree(_: Path) -> None:
+    def fake_rmtree(_: Path, **__: object) -> None:
         raise PermissionError("blocked")
 
     monkeypatch.setattr(shutil, "rmtree", fake_rmtree)
@@ -225,7 +288,7 @@ def test_cli_best_effort_allows_delete_failures(
     target.mkdir(parents=True)
     (target / "file.txt").write_text("content")
 
-    def fake_rmtree(_: Path) -> None:
+    def fake_rmtree(_: Path, **__: object) -> None:
         raise PermissionError("blocked")
 
     monkeypatch.setattr(shutil, "rmtree", fake_rmtree)
@@ -259,6 +322,100 @@ def test_cli_json_output_is_machine_readable(mock_workspace: Path) -> None:
     assert len(payload["items"]) == EXPECTED_FOUND_ITEMS
 
 
+def test_cli_json_output_extends_scan_json(mock_workspace: Path) -> None:
+    """Verify the CLI payload is the engine's scan_json plus cleanup fields."""
+    engine = FSweepEngine(mock_workspace)
+    engine.scan(show_progress=False, use_index=False)
+    scan_payload = engine.scan_json()
+
+    result = runner.invoke(
+        app, ["clean", "--path", str(mock_workspace), "--output", "json", "--no-index"]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["summary"].items() >= scan_payload["summary"].items()
+    assert [
+        {key: item[key] for key in scan_item}
+        for item, scan_item in zip(payload["items"], scan_payload["items"])
+    ] == scan_payload["items"]
+
+
+@pytest.mark.usefixtures("stub_orjson")
+def test_cli_json_output_with_orjson_is_indented_and_sorted(
+    mock_workspace: Path,
+) -> None:
+    """Verify the orjson path writes the same indented, key-sorted JSON."""
+    result = runner.invoke(
+        app, ["clean", "--path", str(mock_workspace), "--output", "json"]
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert result.stdout == json.dumps(payload, indent=2, sort_keys=True) + "\n"
+    assert payload["summary"]["matched_count"] == EXPECTED_FOUND_ITEMS
+
+    error = runner.invoke(
+        app, ["clean", "--path", str(mock_workspace / "missing"), "--output", "json"]
+    )
+    assert error.exit_code == 1
+    error_payload = json.loads(error.stdout)
+    assert error.stdout == json.dumps(error_payload, indent=2, sort_keys=True) + "\n"
+    assert error_payload["exit_code"] == 1
+
+
+@pytest.mark.parametrize("use_orjson", [False, True])
+def test_cli_json_output_keeps_non_ascii_paths(
+    tmp_path: Path, request: pytest.FixtureRequest, use_orjson: bool
+) -> None:
+    """Verify both JSON backends write non-ASCII paths as raw UTF-8."""
+    if use_orjson:
+        request.getfixturevalue("stub_orjson")
+    (tmp_path / "café" / "node_modules").mkdir(parents=True)
+
+    result = runner.invoke(app, ["clean", "--path", str(tmp_path), "--output", "json"])
+    assert result.exit_code == 0
+    assert '"café/node_modules"' in result.stdout
+    assert "\\u" not in result.stdout
+
+
+def test_cli_no_size_skips_sizing(
+    mock_workspace: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify --no-size lists matches without computing any folder size."""
+
+    def fail_get_size(*_: object) -> int:
+        raise AssertionError("get_size should not run with --no-size")
+
+    monkeypatch.setattr(FSweepEngine, "get_size", fail_get_size)
+    result = runner.invoke(
+        app,
+        ["clean", "--path", str(mock_workspace), "--output", "json", "--no-size"],
+    )
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["summary"]["matched_count"] == EXPECTED_FOUND_ITEMS
+    assert payload["summary"]["total_bytes"] is None
+    assert payload["summary"]["total_human"] is None
+    assert {item["size_bytes"] for item in payload["items"]} == {None}
+    assert {item["size_human"] for item in payload["items"]} == {None}
+
+
+def test_cli_writes_markdown_report(mock_workspace: Path, tmp_path: Path) -> None:
+    """Verify --report writes a summary and one table row per item."""
+    report_path = tmp_path / "reports" / "report.md"
+    result = runner.invoke(
+        app, ["clean", "--path", str(mock_workspace), "--report", str(report_path)]
+    )
+    assert result.exit_code == 0
+
+    lines = report_path.read_text().splitlines()
+    assert lines[0] == "# fsweep report"
+    assert f"- matched_count: {EXPECTED_FOUND_ITEMS}" in lines
+    assert f"- skipped: {EXPECTED_FOUND_ITEMS}" in lines
+    item_rows = [line for line in lines if line.startswith("| `")]
+    assert len(item_rows) == EXPECTED_FOUND_ITEMS
+    assert all(row.endswith("| simulated |  |") for row in item_rows)
+
+
 def test_cli_trash_moves_directories(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -2,7 +2,7 @@
 
 import textwrap
 from pathlib import Path
-from typing import Optional, Set
+from typing import FrozenSet, Optional
 
 import pytest
 
@@ -19,7 +19,7 @@ try:
         merge_overrides,
     )
 except ImportError:
-    TARGET_FOLDERS: Optional[Set[str]] = None
+    TARGET_FOLDERS: Optional[FrozenSet[str]] = None
     ConfigOverrides = None  # type: ignore[misc,assignment]
     SweepConfig = None  # type: ignore[misc,assignment]
     load_config_overrides = None  # type: ignore[misc,assignment]
@@ -122,3 +122,29 @@ def test_merge_overrides_applies_additive_lists_and_scalar_override() -> None:
     ]
     assert merged.max_delete_count == EXPECTED_OVERRIDE_MAX_DELETE_COUNT
     assert merged.no_delete_limit is True
+
+
+def test_merge_overrides_deduplicates_in_order() -> None:
+    """Verify repeated merges keep the first occurrence of each entry."""
+    base = SweepConfig(exclude_patterns=["a", "b"])
+    merged = merge_overrides(
+        base,
+        ConfigOverrides(
+            exclude_patterns=["b", "c", "a", "c"],
+            protected_paths=[Path("/tmp/protected"), Path("/tmp/../tmp/protected")],
+        ),
+    )
+    assert merged.exclude_patterns == ["a", "b", "c"]
+    assert merged.protected_paths == [Path("/tmp/protected").resolve()]
+
+
+def test_merge_overrides_deduplicates_unresolved_base_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a caller-built relative protected path matches its resolved form."""
+    monkeypatch.chdir(tmp_path)
+    base = SweepConfig(protected_paths=[Path("rel")])
+    merged = merge_overrides(
+        base, ConfigOverrides(protected_paths=[(tmp_path / "rel").resolve()])
+    )
+    assert merged.protected_paths == [Path("rel")]
@@ -1,5 +1,7 @@
 """Engine-focused tests, including symlink and cleanup behavior."""
 
+import _thread
+import json
 import os
 import shutil
 import time
@@ -7,7 +9,15 @@ from pathlib import Path
 
 import pytest
 
-from fsweep.cli import FSweepEngine
+import fsweep.cli
+from fsweep.cli import (
+    PARALLEL_CLEANUP_THRESHOLD,
+    PARALLEL_SIZE_THRESHOLD,
+    RM_BINARY,
+    FSweepEngine,
+    FSweepLimitExceededError,
+)
+from fsweep.config import SweepConfig
 
 ONE_MIB = 1024 * 1024
 READ_WRITE_EXECUTE_PERMS = 0o755
@@ -81,11 +91,39 @@ def test_get_size_symlink_to_file(symlink_workspace: Path) -> None:
     assert size < ONE_MIB, f"Size {size} indicates file symlink was followed!"
 
 
-def test_get_size_handles_permission_error(tmp_path: Path) -> None:
+def test_get_size_handles_permission_error(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Verify that get_size skips files/folders it cannot access."""
     engine = FSweepEngine(tmp_path)
     restricted_dir = tmp_path / "restricted"
     restricted_dir.mkdir()
+    (restricted_dir / "secret.txt").write_text("shhh")
+
+    # Deny listing the restricted folder without relying on chmod, which does
+    # not restrict root.
+    original_scandir = os.scandir
+
+    def denying_scandir(path: str) -> object:
+        if os.fspath(path) == str(restricted_dir):
+            raise PermissionError(path)
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", denying_scandir)
+
+    # Should not raise PermissionError
+    assert engine.get_size(tmp_path) == 0
+
+
+@pytest.mark.skipif(
+    getattr(os, "geteuid", lambda: -1)() == 0,
+    reason="chmod does not restrict root",
+)
+def test_get_size_handles_unreadable_directory_on_disk(tmp_path: Path) -> None:
+    """Verify get_size skips a directory whose permissions deny listing."""
+    engine = FSweepEngine(tmp_path)
+    restricted_dir = tmp_path / "restricted"
+    restricted_dir.mkdir()
 
     protected_file = restricted_dir / "secret.txt"
     protected_file.write_text("shhh")
@@ -102,6 +140,60 @@ def test_get_size_handles_permission_error(tmp_path: Path) -> None:
         os.chmod(restricted_dir, READ_WRITE_EXECUTE_PERMS)
 
 
+def test_get_size_sums_nested_files(tmp_path: Path) -> None:
+    """Verify get_size includes files in nested subdirectories."""
+    nested = tmp_path / "outer" / "inner"
+    nested.mkdir(parents=True)
+    (tmp_path / "outer" / "top.bin").write_bytes(b"a" * INDEX_CACHE_FILE_BYTES)
+    (nested / "deep.bin").write_bytes(b"b" * INDEX_CACHE_FILE_BYTES)
+
+    engine = FSweepEngine(tmp_path)
+
+    assert engine.get_size(tmp_path / "outer") == 2 * INDEX_CACHE_FILE_BYTES
+
+
+def test_get_size_fans_out_over_subdirectories(tmp_path: Path) -> None:
+    """Verify threaded sizing of one folder matches the sequential total."""
+    target = tmp_path / "node_modules"
+    for idx in range(PARALLEL_SIZE_THRESHOLD + 2):
+        package = target / f"pkg_{idx}" / "lib"
+        package.mkdir(parents=True)
+        (package / "index.js").write_bytes(b"x" * (idx + 1))
+    (target / "top.txt").write_bytes(b"x" * 7)
+
+    engine = FSweepEngine(tmp_path)
+
+    assert engine.get_size(target, jobs=4) == engine.get_size(target)
+
+
+@pytest.mark.parametrize("interrupt", [False, True])
+def test_get_size_returns_when_sizing_fails_mid_drain(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, interrupt: bool
+) -> None:
+    """Verify a failing worker or Ctrl-C stops threaded sizing instead of hanging."""
+    target = tmp_path / "node_modules"
+    for idx in range(PARALLEL_SIZE_THRESHOLD * 4):
+        (target / f"pkg_{idx}" / "lib").mkdir(parents=True)
+    original_level_size = fsweep.cli._scandir_level_size
+    calls = 0
+
+    def failing_level_size(path: str, *args: object) -> int:
+        nonlocal calls
+        calls += 1
+        if calls == PARALLEL_SIZE_THRESHOLD:
+            if interrupt:
+                _thread.interrupt_main()
+            else:
+                raise RuntimeError("boom")
+        return original_level_size(path, *args)
+
+    monkeypatch.setattr("fsweep.cli._scandir_level_size", failing_level_size)
+    engine = FSweepEngine(tmp_path)
+
+    with pytest.raises(KeyboardInterrupt if interrupt else RuntimeError):
+        engine.get_size(target, jobs=4)
+
+
 def test_engine_cleanup_respects_dry_run(tmp_path: Path) -> None:
     """Verify that FSweepEngine.cleanup does not delete files when dry_run is True."""
     junk_dir = tmp_path / "node_modules"
@@ -158,10 +250,10 @@ def test_engine_cleanup_handles_delete_errors(
 
     original_rmtree = shutil.rmtree
 
-    def fake_rmtree(path: Path) -> None:
+    def fake_rmtree(path: Path, **kwargs: object) -> None:
         if Path(path) == failing_dir:
             raise PermissionError("blocked")
-        original_rmtree(path)
+        original_rmtree(path, **kwargs)
 
     monkeypatch.setattr(shutil, "rmtree", fake_rmtree)
 
@@ -174,6 +266,153 @@ def test_engine_cleanup_handles_delete_errors(
     assert stats.failed == 1
 
 
+def test_engine_cleanup_tolerates_entries_vanishing_mid_delete(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify a nested entry removed concurrently does not abort the delete."""
+    target = tmp_path / "project" / "node_modules"
+    (target / "pkg").mkdir(parents=True)
+    (target / "pkg" / "gone.txt").write_text("content")
+    (target / "pkg" / "kept.txt").write_text("content")
+
+    original_unlink = os.unlink
+
+    def racing_unlink(path: str, *args: object, **kwargs: object) -> None:
+        original_unlink(path, *args, **kwargs)
+        if os.fspath(path).endswith("gone.txt"):
+            raise FileNotFoundError(path)
+
+    monkeypatch.setattr(os, "unlink", racing_unlink)
+
+    engine = FSweepEngine(tmp_path)
+    stats, results = engine.cleanup([target], dry_run=False)
+
+    assert results[0].status == "deleted"
+    assert stats.deleted == 1
+    assert not target.exists()
+
+
+def test_engine_cleanup_parallel_preserves_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify concurrent cleanup keeps result order and tallies failures."""
+    items = []
+    for idx in range(PARALLEL_CLEANUP_THRESHOLD + 2):
+        target = tmp_path / f"project_{idx}" / "node_modules"
+        target.mkdir(parents=True)
+        (target / "file.txt").write_text("content")
+        items.append(target)
+    failing_dir = items[1]
+
+    original_rmtree = shutil.rmtree
+
+    def fake_rmtree(path: Path, **kwargs: object) -> None:
+        if Path(path) == failing_dir:
+            raise PermissionError("blocked")
+        original_rmtree(path, **kwargs)
+
+    monkeypatch.setattr(shutil, "rmtree", fake_rmtree)
+    progressed: list[Path] = []
+
+    engine = FSweepEngine(tmp_path)
+    stats, results = engine.cleanup(items, dry_run=False, callback=progressed.append)
+
+    assert [result.path for result in results] == items
+    assert sorted(progressed) == sorted(items)
+    assert stats.deleted == len(items) - 1
+    assert stats.failed == 1
+    assert failing_dir.exists()
+
+
+def test_engine_cleanup_with_single_job_runs_sequentially(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify cleanup with jobs=1 never creates a thread pool."""
+    items = []
+    for idx in range(PARALLEL_CLEANUP_THRESHOLD + 1):
+        target = tmp_path / f"project_{idx}" / "node_modules"
+        target.mkdir(parents=True)
+        items.append(target)
+
+    def fail_pool(*_: object, **__: object) -> None:
+        raise AssertionError("jobs=1 should not use a thread pool")
+
+    monkeypatch.setattr("fsweep.cli.ThreadPoolExecutor", fail_pool)
+
+    engine = FSweepEngine(tmp_path)
+    stats, _ = engine.cleanup(items, dry_run=False, jobs=1)
+
+    assert stats.deleted == len(items)
+    assert not any(item.exists() for item in items)
+
+
+def test_engine_cleanup_uses_native_rm_for_large_trees(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify large trees are removed via `rm -rf` and vanished ones are skipped."""
+    if not os.access(RM_BINARY, os.X_OK):
+        pytest.skip("Native rm is not available on this platform")
+    junk_dir = tmp_path / "node_modules"
+    (junk_dir / "nested").mkdir(parents=True)
+    (junk_dir / "nested" / "file.txt").write_text("content")
+    missing_dir = tmp_path / "venv"
+
+    def fail_rmtree(_: Path, **__: object) -> None:
+        raise AssertionError("shutil.rmtree should not be used for large trees")
+
+    monkeypatch.setattr("fsweep.cli.FAST_RMTREE_MIN_BYTES", 0)
+    monkeypatch.setattr(shutil, "rmtree", fail_rmtree)
+
+    engine = FSweepEngine(tmp_path)
+    stats, _ = engine.cleanup([junk_dir, missing_dir], dry_run=False)
+
+    assert not junk_dir.exists()
+    assert stats.deleted == 1
+    assert stats.skipped == 1
+    assert stats.failed == 0
+
+
+def test_engine_cleanup_refuses_symlinked_match_at_any_size(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify a symlinked match fails and keeps its target on either backend."""
+    real_dir = tmp_path / "real"
+    real_dir.mkdir()
+    (real_dir / "file.txt").write_text("content")
+    link = tmp_path / "node_modules"
+    link.symlink_to(real_dir, target_is_directory=True)
+    monkeypatch.setattr("fsweep.cli.FAST_RMTREE_MIN_BYTES", 0)
+
+    engine = FSweepEngine(tmp_path)
+    stats, results = engine.cleanup([link], dry_run=False)
+
+    assert stats.failed == 1
+    assert results[0].status == "failed"
+    assert (real_dir / "file.txt").exists()
+
+
+def test_move_to_trash_avoids_existing_destination(tmp_path: Path) -> None:
+    """Verify trash moves pick a fresh name when the destination exists."""
+    workspace = tmp_path / "workspace"
+    target = workspace / "project" / "node_modules"
+    target.mkdir(parents=True)
+    trash_root = tmp_path / "trash"
+    occupied = trash_root / "project" / "node_modules"
+    occupied.mkdir(parents=True)
+
+    engine = FSweepEngine(workspace)
+    destination = engine._move_to_trash(target, trash_root=trash_root)
+
+    assert destination.parent == occupied.parent
+    assert destination.name.startswith("node_modules-")
+    assert destination.exists()
+    assert occupied.exists()
+    assert not target.exists()
+
+
 def test_scan_finds_nested_target_directories(tmp_path: Path) -> None:
     """Verify scan finds nested target directories exactly once each."""
     top_target = tmp_path / "project" / "node_modules"
@@ -190,6 +429,18 @@ def test_scan_finds_nested_target_directories(tmp_path: Path) -> None:
     assert Path("project/node_modules/nested/venv") not in found
 
 
+def test_relative_path_matches_relative_to(tmp_path: Path) -> None:
+    """Verify relative_path agrees with Path.relative_to for scanned items."""
+    target = tmp_path / "project" / "nested" / "node_modules"
+    target.mkdir(parents=True)
+
+    engine = FSweepEngine(tmp_path)
+    engine.scan(show_progress=False, use_index=False)
+
+    assert engine.found_items == [target]
+    assert engine.relative_path(target) == str(target.relative_to(tmp_path))
+
+
 def test_scan_handles_symlink_loop(tmp_path: Path) -> None:
     """Verify scan does not recurse through symlink loops."""
     project = tmp_path / "project"
@@ -224,6 +475,160 @@ def test_scan_multi_project_duplicates(tmp_path: Path) -> None:
     assert len(engine.found_items) == EXPECTED_TWO_ITEMS
 
 
+def test_scan_honors_exclude_patterns(tmp_path: Path) -> None:
+    """Verify exclude patterns match both relative paths and folder names."""
+    by_path = tmp_path / "vendor" / "project" / "node_modules"
+    by_name = tmp_path / "archive" / "venv"
+    by_suffix = tmp_path / "legacy.bak" / "node_modules"
+    kept = tmp_path / "app" / "node_modules"
+    for folder in (by_path, by_name, by_suffix, kept):
+        folder.mkdir(parents=True)
+
+    config = SweepConfig(exclude_patterns=["vendor/*", "archive", "*.bak"])
+    engine = FSweepEngine(tmp_path, config)
+    engine.scan(show_progress=False, use_index=False)
+
+    assert engine.found_items == [kept]
+
+
+def test_get_size_counts_subdirectories_matching_exclude_patterns(
+    tmp_path: Path,
+) -> None:
+    """Verify sizing covers everything cleanup removes, excludes included."""
+    target = tmp_path / "node_modules"
+    (target / "react" / "dist").mkdir(parents=True)
+    kept_bytes = 10
+    excluded_bytes = 100
+    (target / "react" / "index.js").write_bytes(b"x" * kept_bytes)
+    (target / "react" / "dist" / "bundle.js").write_bytes(b"x" * excluded_bytes)
+
+    engine = FSweepEngine(tmp_path, SweepConfig(exclude_patterns=["dist"]))
+
+    assert engine.get_size(target) == kept_bytes + excluded_bytes
+
+
+def test_scan_skips_protected_trees_and_links_into_them(tmp_path: Path) -> None:
+    """Verify protection covers the scan root and symlinks into protected trees."""
+    protected = tmp_path / "protected"
+    (protected / "app" / "node_modules").mkdir(parents=True)
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    (workspace / "node_modules").symlink_to(protected / "app" / "node_modules")
+    config = SweepConfig(protected_paths=[protected.resolve()])
+
+    inside = FSweepEngine(protected / "app", config)
+    inside.scan(show_progress=False, use_index=False)
+    linked = FSweepEngine(workspace, config)
+    linked.scan(show_progress=False, use_index=False)
+
+    assert inside.found_items == []
+    assert linked.found_items == []
+
+
+def test_scan_sizes_many_matches_in_walk_order(tmp_path: Path) -> None:
+    """Verify parallel sizing keeps walk order and per-item sizes."""
+    expected = []
+    for idx in range(PARALLEL_SIZE_THRESHOLD + 2):
+        target = tmp_path / f"project_{idx}" / "node_modules"
+        target.mkdir(parents=True)
+        (target / "file.bin").write_bytes(b"x" * (idx + 1))
+        expected.append(target)
+
+    engine = FSweepEngine(tmp_path)
+    engine.scan(show_progress=False, use_index=False)
+
+    assert engine.found_items == expected
+    assert [engine.item_sizes[item] for item in expected] == [
+        idx + 1 for idx in range(len(expected))
+    ]
+
+
+@pytest.mark.parametrize("compute_sizes", [True, False])
+def test_scan_json_describes_found_items(tmp_path: Path, compute_sizes: bool) -> None:
+    """Verify scan_json reports each match with its relative path and size."""
+    target = tmp_path / "app" / "node_modules"
+    target.mkdir(parents=True)
+    (target / "file.txt").write_text("content")
+
+    engine = FSweepEngine(tmp_path)
+    engine.scan(show_progress=False, use_index=False, compute_sizes=compute_sizes)
+    payload = engine.scan_json()
+
+    if compute_sizes:
+        total = (engine.total_bytes, engine.format_size(engine.total_bytes))
+        item_size = engine.item_sizes[target]
+        size = (item_size, engine.format_size(item_size))
+    else:
+        total = size = (None, None)
+    assert payload["summary"] == {
+        "matched_count": 1,
+        "total_bytes": total[0],
+        "total_human": total[1],
+    }
+    assert payload["items"] == [
+        {
+            "path": str(target),
+            "relative_path": "app/node_modules",
+            "type": "node_modules",
+            "size_bytes": size[0],
+            "size_human": size[1],
+        }
+    ]
+
+
+def test_iter_scan_yields_items_as_recorded(tmp_path: Path) -> None:
+    """Verify iter_scan yields each match and leaves scan state populated."""
+    for name in ("a", "b"):
+        target = tmp_path / name / "node_modules"
+        target.mkdir(parents=True)
+        (target / "file.txt").write_text("content")
+
+    engine = FSweepEngine(tmp_path)
+    streamed = list(engine.iter_scan(use_index=False))
+
+    assert [path for path, _ in streamed] == engine.found_items
+    assert dict(streamed) == engine.item_sizes
+    assert engine.total_bytes == sum(engine.item_sizes.values())
+
+
+def test_scan_stops_before_sizing_when_over_max_items(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify max_items fails the scan before any folder is sized."""
+    match_count = 3
+    for idx in range(match_count):
+        (tmp_path / f"project_{idx}" / "node_modules").mkdir(parents=True)
+
+    def fail_get_size(_: Path) -> int:
+        raise AssertionError("get_size should not run once the limit is exceeded")
+
+    engine = FSweepEngine(tmp_path)
+    monkeypatch.setattr(engine, "get_size", fail_get_size)
+    with pytest.raises(FSweepLimitExceededError) as exc_info:
+        engine.scan(show_progress=False, use_index=False, max_items=match_count - 1)
+
+    assert exc_info.value.count == match_count
+    assert engine.found_items == []
+
+
+def test_scan_with_single_job_sizes_sequentially(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Verify jobs=1 never creates a thread pool."""
+    for idx in range(PARALLEL_SIZE_THRESHOLD + 1):
+        (tmp_path / f"project_{idx}" / "node_modules").mkdir(parents=True)
+
+    def fail_pool(*_: object, **__: object) -> None:
+        raise AssertionError("jobs=1 should not use a thread pool")
+
+    monkeypatch.setattr("fsweep.cli.ThreadPoolExecutor", fail_pool)
+
+    engine = FSweepEngine(tmp_path)
+    engine.scan(show_progress=False, use_index=False, jobs=1)
+
+    assert len(engine.found_items) == PARALLEL_SIZE_THRESHOLD + 1
+
+
 def test_scan_permission_restricted_target_folder(tmp_path: Path) -> None:
     """Verify scan does not crash when target folder permissions are restricted."""
     restricted = tmp_path / "project" / "node_modules"
@@ -271,9 +676,10 @@ def test_scan_writes_index_file(tmp_path: Path) -> None:
     engine.scan(show_progress=False, use_index=True, index_path=index_file)
 
     assert index_file.exists()
-    contents = index_file.read_text()
-    assert '"schema_version": "1"' in contents
-    assert str(target.resolve()) in contents
+    contents = json.loads(index_file.read_text())
+    assert contents["schema_version"] == "1"
+    assert str(target.resolve()) in contents["entries"]
+    assert list(tmp_path.glob("*.tmp")) == []
 
 
 def test_scan_uses_index_cache_when_unchanged(
@@ -297,3 +703,25 @@ def test_scan_uses_index_cache_when_unchanged(
     second_engine.scan(show_progress=False, use_index=True, index_path=index_file)
 
     assert second_engine.item_sizes[target] == INDEX_CACHE_FILE_BYTES
+
+
+def test_scan_ignores_index_entry_for_replaced_folder(tmp_path: Path) -> None:
+    """Verify an index entry with a stale inode is recomputed."""
+    target = tmp_path / "project" / "node_modules"
+    target.mkdir(parents=True)
+    (target / "file.txt").write_bytes(b"x" * INDEX_CACHE_FILE_BYTES)
+    index_file = tmp_path / ".fsweep-index.json"
+
+    FSweepEngine(tmp_path).scan(
+        show_progress=False, use_index=True, index_path=index_file
+    )
+    contents = json.loads(index_file.read_text())
+    entry = contents["entries"][str(target.resolve())]
+    entry["inode"] += 1
+    entry["size_bytes"] = 1
+    index_file.write_text(json.dumps(contents))
+
+    engine = FSweepEngine(tmp_path)
+    engine.scan(show_progress=False, use_index=True, index_path=index_file)
+
+    assert engine.item_sizes[target] == INDEX_CACHE_FILE_BYTES